@@ -1,41 +1,21 @@
 import tkinter as tk
 
+from Systems.win_theme import apply_dark_titlebar
+
 class DentalWindow:
     def __init__(self, parent):
         self.window = tk.Toplevel(parent)
         self.window.title("Dental System - Human Body Systems Viewer")
         self.window.configure(bg="#2a2a2a")
         self.window.state('zoomed')
-        self.window.bind('<Escape>', lambda e: self.window.destroy())
+        self.window.bind('<Escape>', lambda e: self.window.withdraw())
 
-        # Force window creation before applying dark title bar
+        # Flush pending geometry so the window handle exists for the dark title bar
         self.window.update_idletasks()
-        self.window.update()
 
         print("hello world!")
-        # Try dark title bar (Windows 10/11)
-        try:
-            from ctypes import windll, byref, sizeof, c_int
-
-            HWND = windll.user32.GetParent(self.window.winfo_id())
-            if HWND == 0:
-                HWND = self.window.winfo_id()
-
-            # Use immersive dark mode attribute
-            DWMWA_USE_IMMERSIVE_DARK_MODE = 20  # works on most Windows 11 builds
-            value = c_int(1)
-            result = windll.dwmapi.DwmSetWindowAttribute(
-                HWND, DWMWA_USE_IMMERSIVE_DARK_MODE, byref(value), sizeof(value)
-            )
-
-            # Fallback for older Windows 10 builds
-            if result != 0:
-                DWMWA_USE_IMMERSIVE_DARK_MODE = 19
-                windll.dwmapi.DwmSetWindowAttribute(
-                    HWND, DWMWA_USE_IMMERSIVE_DARK_MODE, byref(value), sizeof(value)
-                )
-        except Exception as e:
-            print(f"Could not set dark title bar: {e}")
+        # Dark title bar (Windows 10/11)
+        apply_dark_titlebar(self.window)
 
         sidebar = tk.Frame(self.window, bg="#2a2a2a", width=300)
         sidebar.pack(side=tk.LEFT, fill=tk.Y)
@@ -64,3 +44,9 @@ class DentalWindow:
 
         tk.Label(viz_area, text="Press ESC to return",
                  font=("Segoe UI", 10), bg="#1a1a1a", fg="#555555").pack(side=tk.BOTTOM, pady=20)
+
+    def show(self):
+        """Bring a previously hidden window back to the front"""
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
@@ -0,0 +1,51 @@
+import sys
+
+# Resolve the Windows API handles once at import; every window reuses them
+_IS_WIN = sys.platform == 'win32'
+
+if _IS_WIN:
+    from ctypes import windll, byref, sizeof, c_int
+
+    _USER32 = windll.user32
+    _DWMAPI = windll.dwmapi
+
+DWMWA_USE_IMMERSIVE_DARK_MODE = 20  # works on most Windows 11 builds
+DWMWA_USE_IMMERSIVE_DARK_MODE_LEGACY = 19  # older Windows 10 builds
+
+
+def apply_dark_titlebar(window):
+    """Switch a Tk window to the dark title bar (no-op outside Windows)"""
+    if not _IS_WIN:
+        return
+
+    try:
+        HWND = _USER32.GetParent(window.winfo_id())
+        if HWND == 0:
+            HWND = window.winfo_id()
+
+        value = c_int(1)
+        result = _DWMAPI.DwmSetWindowAttribute(
+            HWND, DWMWA_USE_IMMERSIVE_DARK_MODE, byref(value), sizeof(value)
+        )
+
+        # Fallback for older Windows 10 builds
+        if result != 0:
+            _DWMAPI.DwmSetWindowAttribute(
+                HWND, DWMWA_USE_IMMERSIVE_DARK_MODE_LEGACY, byref(value), sizeof(value)
+            )
+    except Exception as e:
+        print(f"Could not set dark title bar: {e}")
+
+
+def enable_dpi_awareness():
+    """Enable high DPI awareness for sharper text (no-op outside Windows)"""
+    if not _IS_WIN:
+        return
+
+    try:
+        windll.shcore.SetProcessDpiAwareness(1)  # System DPI aware
+    except Exception:
+        try:
+            _USER32.SetProcessDPIAware()  # Older Windows versions
+        except Exception:
+            pass
@@ -1,15 +1,28 @@
+import importlib
+import itertools
+import math
 import tkinter as tk
 from tkinter import filedialog
 from tkinter import font
 
-from Systems.Cardiac_System import CardiacWindow
-from Systems.Nervous_System import NervousWindow
-from Systems.Musculoskeletal_System import MusculoskeletalWindow
-from Systems.Dental_System import DentalWindow
+from Systems.win_theme import apply_dark_titlebar, enable_dpi_awareness
+
+
+def _arc_points(cx, cy, radius, start, stop):
+    """Return (x, y) points of an arc around (cx, cy) every 5 degrees from start to stop"""
+    return [
+        (cx + radius * math.cos(math.radians(angle)), cy - radius * math.sin(math.radians(angle)))
+        for angle in range(start, stop + 1, 5)
+    ]
 
 
 class ModernButton(tk.Canvas):
     """Custom modern button with rounded corners and hover effects"""
+    # Rounded rectangle geometry (identical for every button)
+    _RECT = (10, 10, 440, 190)
+    _RADIUS = 24
+    _BORDER_POINTS = None
+
     def __init__(self, parent, text, emoji, command=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.text = text
@@ -65,77 +78,49 @@ class ModernButton(tk.Canvas):
         
     def create_rounded_rect(self):
         """Create a rounded rectangle with smooth edges"""
-        x1, y1, x2, y2 = 10, 10, 440, 190
-        radius = 24
-        
-        # Create smooth rounded rectangle using arc-based approach
-        self.rect = self.create_rectangle(
-            x1 + radius, y1,
-            x2 - radius, y2,
+        # Single smoothed polygon with a subtle border
+        self.rect = self.create_polygon(
+            ModernButton._compute_border_points(),
             fill=self.current_color,
-            outline="",
+            outline="#404040",
+            smooth=True,
             tags="rect"
         )
         
-        # Top and bottom rectangles
-        self.create_rectangle(x1, y1 + radius, x2, y2 - radius, fill=self.current_color, outline="", tags="rect")
-        
-        # Four corner circles
-        self.create_oval(x1, y1, x1 + radius * 2, y1 + radius * 2, fill=self.current_color, outline="", tags="rect")
-        self.create_oval(x2 - radius * 2, y1, x2, y1 + radius * 2, fill=self.current_color, outline="", tags="rect")
-        self.create_oval(x1, y2 - radius * 2, x1 + radius * 2, y2, fill=self.current_color, outline="", tags="rect")
-        self.create_oval(x2 - radius * 2, y2 - radius * 2, x2, y2, fill=self.current_color, outline="", tags="rect")
-        
-        # Subtle border
-        self.create_rounded_rect_border(x1, y1, x2, y2, radius, "#404040", 1)
-        
         # Raise content to top
         self.tag_raise("content")
         
-    def create_rounded_rect_border(self, x1, y1, x2, y2, radius, color, width):
-        """Create border for rounded rectangle"""
-        points = []
-        # Top side
-        for i in range(x1 + radius, x2 - radius + 1):
-            points.append((i, y1))
-        # Right top arc
-        for angle in range(0, 91, 5):
-            import math
-            x = x2 - radius + radius * math.cos(math.radians(angle))
-            y = y1 + radius - radius * math.sin(math.radians(angle))
-            points.append((x, y))
-        # Right side
-        for i in range(y1 + radius, y2 - radius + 1):
-            points.append((x2, i))
-        # Right bottom arc
-        for angle in range(90, 181, 5):
-            import math
-            x = x2 - radius + radius * math.cos(math.radians(angle))
-            y = y2 - radius - radius * math.sin(math.radians(angle))
-            points.append((x, y))
-        # Bottom side
-        for i in range(x2 - radius, x1 + radius - 1, -1):
-            points.append((i, y2))
-        # Left bottom arc
-        for angle in range(180, 271, 5):
-            import math
-            x = x1 + radius + radius * math.cos(math.radians(angle))
-            y = y2 - radius - radius * math.sin(math.radians(angle))
-            points.append((x, y))
-        # Left side
-        for i in range(y2 - radius, y1 + radius - 1, -1):
-            points.append((x1, i))
-        # Left top arc
-        for angle in range(270, 361, 5):
-            import math
-            x = x1 + radius + radius * math.cos(math.radians(angle))
-            y = y1 + radius - radius * math.sin(math.radians(angle))
-            points.append((x, y))
-        
-        if len(points) > 2:
-            flat_points = [coord for point in points for coord in point]
-            self.create_line(flat_points, fill=color, width=width, smooth=True, tags="border")
-        
+    @classmethod
+    def _compute_border_points(cls):
+        """Build the flat border coordinate list once and cache it on the class"""
+        if cls._BORDER_POINTS is not None:
+            return cls._BORDER_POINTS
+
+        x1, y1, x2, y2 = cls._RECT
+        radius = cls._RADIUS
+        points = itertools.chain(
+            # Top side
+            zip(range(x1 + radius, x2 - radius + 1), itertools.repeat(y1)),
+            # Right top arc
+            _arc_points(x2 - radius, y1 + radius, radius, 0, 90),
+            # Right side
+            zip(itertools.repeat(x2), range(y1 + radius, y2 - radius + 1)),
+            # Right bottom arc
+            _arc_points(x2 - radius, y2 - radius, radius, 90, 180),
+            # Bottom side
+            zip(range(x2 - radius, x1 + radius - 1, -1), itertools.repeat(y2)),
+            # Left bottom arc
+            _arc_points(x1 + radius, y2 - radius, radius, 180, 270),
+            # Left side
+            zip(itertools.repeat(x1), range(y2 - radius, y1 + radius - 1, -1)),
+            # Left top arc
+            _arc_points(x1 + radius, y1 + radius, radius, 270, 360),
+        )
+
+        # Flatten to x0, y0, x1, y1, ... in a single pass
+        cls._BORDER_POINTS = tuple(itertools.chain.from_iterable(points))
+        return cls._BORDER_POINTS
+
     def update_color(self, color):
         """Update button color with smooth transition"""
         self.current_color = color
@@ -167,6 +152,17 @@ class MedicalSystemsGUI:
         self.root = root
         self.root.title("Human Body Systems Viewer")
         
+        # System name -> (module, window class); modules are imported on first use
+        self._system_classes = {
+            "Cardiac System": ("Systems.Cardiac_System", "CardiacWindow"),
+            "Nervous System": ("Systems.Nervous_System", "NervousWindow"),
+            "Musculoskeletal System": ("Systems.Musculoskeletal_System", "MusculoskeletalWindow"),
+            "Dental System": ("Systems.Dental_System", "DentalWindow"),
+        }
+        
+        # System windows are created lazily and reused on later opens
+        self._windows = {}
+        
         # Remove white title bar and use dark theme
         try:
             # Windows 10/11 dark title bar
@@ -176,14 +172,7 @@ class MedicalSystemsGUI:
             root.tk.call("wm", "attributes", ".", "-alpha", 1.0)
             
             # Try to set dark title bar (Windows 11)
-            try:
-                from ctypes import windll, byref, sizeof, c_int
-                HWND = windll.user32.GetParent(root.winfo_id())
-                DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-                value = c_int(2)
-                windll.dwmapi.DwmSetWindowAttribute(HWND, DWMWA_USE_IMMERSIVE_DARK_MODE, byref(value), sizeof(value))
-            except:
-                pass
+            apply_dark_titlebar(root)
         except:
             pass
         
@@ -287,14 +276,15 @@ class MedicalSystemsGUI:
     def open_system(self, system_name, emoji):
 
         """Open detail window for a specific system"""
-        if system_name == "Cardiac System":
-            CardiacWindow(self.root)
-        elif system_name == "Nervous System":
-            NervousWindow(self.root)
-        elif system_name == "Musculoskeletal System":
-            MusculoskeletalWindow(self.root)
-        elif system_name == "Dental System":
-            DentalWindow(self.root)
+        window = self._windows.get(system_name)
+        if window is not None and window.window.winfo_exists():
+            window.show()
+            return
+
+        module_name, class_name = self._system_classes[system_name]
+        window_class = getattr(importlib.import_module(module_name), class_name)
+        window = window_class(self.root)
+        self._windows[system_name] = window
 
 
 
@@ -302,15 +292,7 @@ def main():
     root = tk.Tk()
     
     # Enable high DPI awareness for sharper text on Windows
-    try:
-        from ctypes import windll
-        windll.shcore.SetProcessDpiAwareness(1)  # System DPI aware
-    except:
-        try:
-            from ctypes import windll
-            windll.user32.SetProcessDPIAware()  # Older Windows versions
-        except:
-            pass
+    enable_dpi_awareness()
     
     app = MedicalSystemsGUI(root)
     root.mainloop()
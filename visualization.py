@@ -40,6 +40,8 @@ FEATURES:
 
 import pyvista as pv
 import numpy as np
+from vtkmodules.vtkIOGeometry import vtkOBJReader
+from vtkmodules.vtkRenderingCore import vtkLightKit
 from pathlib import Path
 import sys
 
@@ -84,6 +86,9 @@ BACKGROUND_COLOR = (0.18, 0.18, 0.18)  # Dark neutral gray
 # Default transparency (1.0 = fully opaque, 0.0 = fully transparent)
 DEFAULT_OPACITY = 1.0
 
+# Fraction of triangles removed for the low-detail model shown while rotating
+LOD_REDUCTION = 0.5
+
 # Lighting settings for realistic tissue appearance
 LIGHTING_CONFIG = {
     'ambient': 0.35,      # Ambient light (prevents pure black shadows)
@@ -121,13 +126,21 @@ def load_obj_files(folder_path):
     return obj_files
 
 
-def apply_realistic_material(actor, color):
+def build_part_lookup_table():
+    """Build a lookup table with one RGBA entry per palette color."""
+    rgba = np.ones((len(ALL_COLORS), 4))
+    rgba[:, :3] = ALL_COLORS
+    
+    lut = pv.LookupTable()
+    lut.values = np.round(rgba * 255).astype(np.uint8)
+    lut.scalar_range = (0, max(len(ALL_COLORS) - 1, 1))
+    return lut
+
+
+def apply_realistic_material(actor):
     """Apply realistic tissue material properties to an actor."""
     prop = actor.GetProperty()
     
-    # Set color
-    prop.SetColor(color)
-    
     # Apply lighting properties for organic tissue
     prop.SetAmbient(LIGHTING_CONFIG['ambient'])
     prop.SetDiffuse(LIGHTING_CONFIG['diffuse'])
@@ -141,51 +154,68 @@ def apply_realistic_material(actor, color):
     prop.SetOpacity(DEFAULT_OPACITY)
 
 
+def add_interaction_observers(plotter, on_start, on_end):
+    """Call on_start/on_end when the user starts/stops dragging the camera.
+    
+    The interactor style also fires a Start/End pair around every single
+    mouse-wheel step; those are skipped so a scroll step renders once.
+    """
+    interactor = plotter.iren.interactor
+    style = interactor.GetInteractorStyle()
+    in_wheel_step = [False]
+    
+    def set_wheel_step(value):
+        in_wheel_step[0] = value
+    
+    # Higher priority runs before the style's own wheel handler, lower after it
+    for event in ('MouseWheelForwardEvent', 'MouseWheelBackwardEvent'):
+        interactor.AddObserver(event, lambda *_: set_wheel_step(True), 1.0)
+        interactor.AddObserver(event, lambda *_: set_wheel_step(False), -1.0)
+    
+    style.AddObserver('StartInteractionEvent', lambda *_: in_wheel_step[0] or on_start())
+    style.AddObserver('EndInteractionEvent', lambda *_: in_wheel_step[0] or on_end())
+
+
+def enable_post_processing(plotter):
+    """Enable the per-pixel passes used for the still, high-quality view."""
+    # Enable anti-aliasing for smoother edges
+    plotter.enable_anti_aliasing('fxaa')
+    
+    # Enable subtle ambient occlusion for depth
+    try:
+        plotter.enable_ssao(radius=10, bias=0.01, kernel_size=32, blur=True)
+    except:
+        pass  # SSAO not available in all PyVista versions
+
+
 def setup_realistic_lighting(plotter):
     """Configure soft, realistic lighting for medical visualization."""
     
     # Remove default lighting
     plotter.remove_all_lights()
     
+    # Key/fill/back/head rig configured in one go and added in a single call
+    light_kit = vtkLightKit()
+    
     # Key light (main light source) - soft and from above-front
-    key_light = pv.Light(
-        position=(10, 15, 10),
-        focal_point=(0, 0, 0),
-        color='white',
-        intensity=0.6,
-        light_type='scene light'
-    )
-    plotter.add_light(key_light)
+    light_kit.SetKeyLightIntensity(0.6)
     
     # Fill light (softens shadows) - from below-left
-    fill_light = pv.Light(
-        position=(-8, -5, 8),
-        focal_point=(0, 0, 0),
-        color='white',
-        intensity=0.25,
-        light_type='scene light'
-    )
-    plotter.add_light(fill_light)
+    light_kit.SetKeyToFillRatio(2.4)     # 0.25 intensity
     
     # Back light (rim lighting for depth) - from behind
-    back_light = pv.Light(
-        position=(0, 5, -12),
-        focal_point=(0, 0, 0),
-        color='white',
-        intensity=0.20,
-        light_type='scene light'
-    )
-    plotter.add_light(back_light)
-    
-    # Ambient light (very subtle, fills in dark areas)
-    ambient_light = pv.Light(
-        position=(0, -10, 0),
-        focal_point=(0, 0, 0),
-        color='white',
-        intensity=0.12,
-        light_type='scene light'
-    )
-    plotter.add_light(ambient_light)
+    light_kit.SetKeyToBackRatio(6.0)     # Two back lights, 0.10 each (0.20 total)
+    
+    # Head light (very subtle, fills in dark areas)
+    light_kit.SetKeyToHeadRatio(5.0)     # 0.12 intensity
+    
+    # Neutral white for every light
+    light_kit.SetKeyLightWarmth(0.5)
+    light_kit.SetFillLightWarmth(0.5)
+    light_kit.SetBackLightWarmth(0.5)
+    light_kit.SetHeadLightWarmth(0.5)
+    
+    light_kit.AddLightsToRenderer(plotter.renderer)
 
 
 # ============================================================================
@@ -202,46 +232,27 @@ def create_realistic_heart_viewer(obj_files):
     # Configure window
     plotter.window_size = [1920, 1080]
     
-    # Store actors and meshes for manipulation
-    actors = []
-    meshes = []
+    # Collect every part into one composite dataset
+    blocks = pv.MultiBlock()
     
     print("Loading and rendering heart model...")
     print(f"{'='*60}")
     
-    # Load and add each mesh to the scene
+    # One OBJ reader is reused for every file (skips pv.read's per-call dispatch)
+    reader = vtkOBJReader()
+    
+    # Load each mesh and tag its points with its palette index (drives coloring;
+    # point data survives decimation, cell data does not)
     for idx, obj_file in enumerate(obj_files):
         try:
-            # Load the mesh
-            mesh = pv.read(str(obj_file))
-            meshes.append(mesh)
-            
-            # Compute normals for smooth shading (essential for realism)
-            mesh = mesh.compute_normals(
-                cell_normals=False,
-                point_normals=True,
-                split_vertices=False,
-                flip_normals=False,
-                consistent_normals=True,
-                auto_orient_normals=True
-            )
-            
-            # Select color from realistic palette
-            color = ALL_COLORS[idx % len(ALL_COLORS)]
-            
-            # Add mesh with basic settings first
-            actor = plotter.add_mesh(
-                mesh,
-                color=color,
-                smooth_shading=True,
-                show_edges=False,
-                name=obj_file.stem
-            )
-            
-            # Apply realistic material properties
-            apply_realistic_material(actor, color)
-            
-            actors.append(actor)
+            reader.SetFileName(str(obj_file))
+            reader.Update()
+            # Shallow copy so the next Update() does not overwrite this part
+            mesh = pv.wrap(reader.GetOutput()).copy(deep=False)
+            if mesh.n_points == 0:
+                raise ValueError("no geometry could be read")
+            mesh.point_data["part_id"] = np.full(mesh.n_points, idx % len(ALL_COLORS), dtype=np.int32)
+            blocks.append(mesh, obj_file.stem)
             
             print(f"  ✓ Loaded: {obj_file.name}")
             
@@ -250,29 +261,104 @@ def create_realistic_heart_viewer(obj_files):
     
     print(f"{'='*60}")
     
-    if not actors:
+    if not blocks.n_blocks:
         print("Error: No meshes were successfully loaded!")
         sys.exit(1)
     
-    print(f"\n✓ Successfully loaded {len(actors)} heart components\n")
+    print(f"\n✓ Successfully loaded {blocks.n_blocks} heart components\n")
+    
+    # Merge all parts and compute normals for smooth shading in one pass
+    # (skipped when every OBJ already ships vertex normals)
+    heart = blocks.combine().extract_surface()
+    if "Normals" not in heart.point_data:
+        heart = heart.compute_normals(
+            cell_normals=False,
+            point_normals=True,
+            split_vertices=False,
+            flip_normals=False,
+            consistent_normals=True,
+            auto_orient_normals=True
+        )
+    
+    # Add the whole heart as a single actor colored per part. Smoothness comes
+    # from the normals above plus Phong interpolation (apply_realistic_material);
+    # smooth_shading=True would recompute and overwrite the OBJ normals.
+    lut = build_part_lookup_table()
+    actor = plotter.add_mesh(
+        heart,
+        scalars="part_id",
+        cmap=lut,
+        clim=lut.scalar_range,
+        categories=True,
+        show_scalar_bar=False,
+        show_edges=False,
+        name="heart"
+    )
+    
+    # Apply realistic material properties
+    apply_realistic_material(actor)
+    heart_property = actor.GetProperty()
+    
+    # Decimated copy drawn instead of the full model while the camera is dragged
+    heart_lod = heart.triangulate().decimate_pro(LOD_REDUCTION, preserve_topology=True)
+    lod_actor = plotter.add_mesh(
+        heart_lod,
+        scalars="part_id",
+        cmap=lut,
+        clim=lut.scalar_range,
+        categories=True,
+        show_scalar_bar=False,
+        show_edges=False,
+        name="heart_lod"
+    )
+    lod_actor.SetProperty(heart_property)  # Shared material and opacity
+    lod_actor.SetVisibility(False)
+    
+    def show_lod():
+        actor.SetVisibility(False)
+        lod_actor.SetVisibility(True)
+    
+    def show_full():
+        lod_actor.SetVisibility(False)
+        actor.SetVisibility(True)
     
     # Setup realistic lighting
     setup_realistic_lighting(plotter)
     
-    # Enable anti-aliasing for smoother edges
-    plotter.enable_anti_aliasing('fxaa')
+    # Anti-aliasing and ambient occlusion only while the view is still
+    enable_post_processing(plotter)
     
-    # Enable subtle ambient occlusion for depth
-    try:
-        plotter.enable_ssao(radius=10, bias=0.01, kernel_size=32, blur=True)
-    except:
-        pass  # SSAO not available in all PyVista versions
+    # The SSAO render pass is built once and swapped out while dragging, rather
+    # than torn down and rebuilt (FBOs, shaders) on every interaction
+    post_pass = plotter.renderer.GetPass()
+    
+    def pause_post_processing():
+        plotter.renderer.SetUseFXAA(False)
+        plotter.renderer.SetPass(None)
+    
+    def resume_post_processing():
+        plotter.renderer.SetPass(post_pass)
+        plotter.renderer.SetUseFXAA(True)
+    
+    # Drags show the LOD without post-processing; wheel steps keep the full
+    # model with SSAO/FXAA and render once, as before
+    def start_drag():
+        show_lod()
+        pause_post_processing()
+    
+    def end_drag():
+        resume_post_processing()
+        show_full()
+    
+    add_interaction_observers(plotter, start_drag, end_drag)
     
     # Add opacity control slider with dark theme
+    # (both heart actors share one property, so a single call covers all parts)
     def update_opacity(value):
         """Update opacity of all heart parts."""
-        for actor in actors:
-            actor.GetProperty().SetOpacity(value)
+        # Called once on slider release (pyvista's default 'end' event); the
+        # widget renders the frame itself
+        heart_property.SetOpacity(value)
     
     slider_widget = plotter.add_slider_widget(
         update_opacity,